@@ -16,16 +16,28 @@
 
 from __future__ import unicode_literals
 import distutils.core
+import os
 
 try:
 	import setuptools
 except ImportError:
 	pass
 
+# Optional: compile the modules of the request path with Cython when
+# TORNADOWS_CYTHON is set, the .py sources are used when it is not.
+ext_modules = []
+if os.environ.get('TORNADOWS_CYTHON'):
+	from Cython.Build import cythonize
+	ext_modules = cythonize(
+		['tornadows/soaphandler.py', 'tornadows/wsdl.py'],
+		compiler_directives={'language_level': 3},
+	)
+
 distutils.core.setup(
 	name='tornadows',
 	version = '0.9.3',
 	packages=['tornadows','demos'],
+	ext_modules=ext_modules,
 	author='Innovaser',
 	author_email='rancavil@innovaser.cl',
 )
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+#
+# Copyright 2011 Rodrigo Ancavil del Pino
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+""" Runs the tests of test_soaphandler against the modules compiled with Cython
+    (TORNADOWS_CYTHON=1 python setup.py build), it is skipped without Cython.
+"""
+from __future__ import unicode_literals
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+try:
+    import Cython
+except ImportError:
+    Cython = None
+
+TESTS = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(TESTS)
+
+CHECK_COMPILED = (
+    'import tornadows.soaphandler, tornadows.wsdl; '
+    'assert not tornadows.soaphandler.__file__.endswith(".py"), tornadows.soaphandler.__file__; '
+    'assert not tornadows.wsdl.__file__.endswith(".py"), tornadows.wsdl.__file__'
+)
+
+
+@unittest.skipIf(Cython is None, 'Cython is not installed')
+class CythonTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def run_python(self, args, cwd=None, **env):
+        environ = dict(os.environ, **env)
+        process = subprocess.run([sys.executable] + args, cwd=cwd or self.tmp, env=environ,
+                                 stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        self.assertEqual(process.returncode, 0, process.stdout.decode('utf-8', 'replace'))
+
+    def test_soaphandler_compiled(self):
+        # cythonize writes the .c files next to the sources, it builds a copy
+        source = os.path.join(self.tmp, 'source')
+        shutil.copytree(ROOT, source, ignore=shutil.ignore_patterns('.git', 'build', '__pycache__'))
+        lib = os.path.join(self.tmp, 'lib')
+        self.run_python(['setup.py', '-q', 'build', '--build-base', os.path.join(self.tmp, 'build'),
+                         '--build-lib', lib], cwd=source, TORNADOWS_CYTHON='1')
+        # the extensions are imported before the .py sources in the same directory
+        self.run_python(['-c', CHECK_COMPILED], PYTHONPATH=lib)
+        self.run_python(['-m', 'unittest', 'discover', '-s', TESTS, '-p', 'test_soaphandler.py'],
+                        PYTHONPATH=lib)
+
+
+if __name__ == '__main__':
+    unittest.main()
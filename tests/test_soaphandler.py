@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+#
+# Copyright 2011 Rodrigo Ancavil del Pino
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+""" Tests of the dispatch of soap requests to the operators of a SoapHandler """
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+import unittest
+import tornado.testing
+import tornado.web
+from tornadows import soaphandler
+from tornadows import xmltypes
+from tornadows import complextypes
+from tornadows import _xml
+from tornadows.soaphandler import webservice
+
+
+class Numbers(complextypes.ComplexType):
+    a = int
+    b = int
+
+
+class MathService(soaphandler.SoapHandler):
+    @webservice(_params=[xmltypes.Integer, xmltypes.Integer], _returns=xmltypes.Integer)
+    def add(self, a, b):
+        return a + b
+
+    @webservice(_params=[xmltypes.Integer, xmltypes.Integer], _returns=xmltypes.Integer)
+    def sub(self, a, b):
+        return a - b
+
+    @webservice(_params=Numbers, _returns=xmltypes.Integer)
+    def mul(self, input):
+        return input.a * input.b
+
+
+class ParamsService(soaphandler.SoapHandler):
+    @webservice(_params=[xmltypes.Integer, xmltypes.Integer], _returns=xmltypes.Integer)
+    def add(self, a, b):
+        return a + b
+
+    @webservice(_params=xmltypes.Integer, _returns=xmltypes.Integer)
+    def params(self, a):
+        return -a
+
+
+class EchoService(soaphandler.SoapHandler):
+    @webservice(_params=xmltypes.String, _returns=xmltypes.String)
+    def echo(self, message):
+        return message
+
+
+WSDL_NS = 'http://schemas.xmlsoap.org/wsdl/'
+
+ENVELOPE = (
+    '<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">'
+    '<soapenv:Header/><soapenv:Body>%s</soapenv:Body></soapenv:Envelope>'
+)
+
+
+class DispatchTest(tornado.testing.AsyncHTTPTestCase):
+    def get_app(self):
+        return tornado.web.Application([
+            (r'/MathService', MathService),
+            (r'/ParamsService', ParamsService),
+            (r'/EchoService', EchoService),
+        ])
+
+    def post(self, uri, body):
+        response = self.fetch(uri, method='POST', body=ENVELOPE % body)
+        self.assertEqual(response.code, 200)
+        envelope = _xml.parse(response.body)
+        return envelope.find(_xml.qname(_xml.SOAPENV_NS, 'Body'))[0]
+
+    def test_operation_name(self):
+        self.assertEqual(self.post('/MathService', '<add><a>5</a><b>2</b></add>').text, '7')
+        self.assertEqual(self.post('/MathService', '<sub><a>5</a><b>2</b></sub>').text, '3')
+
+    def test_complextype_input(self):
+        self.assertEqual(self.post('/MathService', '<Numbers><a>5</a><b>2</b></Numbers>').text, '10')
+
+    def test_complextype_input_processing_instruction(self):
+        body = '<Numbers><a>5</a><?pi x?><b>2</b></Numbers>'
+        self.assertEqual(self.post('/MathService', body).text, '10')
+
+    def test_params_is_the_last_operator(self):
+        # the wsdl describes the last operator by name, the one called for params
+        self.assertEqual(self.post('/MathService', '<params><a>5</a><b>2</b></params>').text, '3')
+
+    def test_operation_name_over_params(self):
+        self.assertEqual(self.post('/ParamsService', '<params><a>5</a></params>').text, '-5')
+        self.assertEqual(self.post('/ParamsService', '<add><a>5</a><b>2</b></add>').text, '7')
+
+    def test_unknown_name(self):
+        element = self.post('/MathService', '<div><a>5</a><b>2</b></div>')
+        self.assertEqual(element.tag, _xml.qname(_xml.SOAPENV_NS, 'Fault'))
+        self.assertEqual(element.find('faultstring').text, 'Operation not found : div')
+
+    def test_empty_body(self):
+        response = self.fetch('/MathService', method='POST', body=ENVELOPE % '')
+        self.assertEqual(response.code, 200)
+        self.assertEqual(response.body, b'')
+
+    def test_single_operator_any_name(self):
+        element = self.post('/EchoService', '<anything><message>hi</message></anything>')
+        self.assertEqual(element.text, 'hi')
+
+
+class WsdlTest(tornado.testing.AsyncHTTPTestCase):
+    def get_app(self):
+        return tornado.web.Application([(r'/MathService', MathService)])
+
+    def setUp(self):
+        super(WsdlTest, self).setUp()
+        soaphandler._createWsdl.cache_clear()
+
+    def test_generated_wsdl(self):
+        response = self.fetch('/MathService?wsdl')
+        self.assertEqual(response.code, 200)
+        definitions = _xml.parse(response.body)
+        operations = list(definitions.iter(_xml.qname(WSDL_NS, 'operation')))
+        self.assertTrue(operations)
+        # the wsdl describes the last operator, by name
+        self.assertEqual(set(o.get('name') for o in operations), {'sub'})
+
+    def test_generated_wsdl_cached(self):
+        first = self.fetch('/MathService?wsdl').body
+        second = self.fetch('/MathService?WSDL').body
+        self.assertEqual(first, second)
+        info = soaphandler._createWsdl.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+
+    def test_wsdl_path(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        path = os.path.join(tmp, 'MathService.wsdl')
+        with open(path, 'wb') as fd:
+            fd.write(b'<definitions name="first"/>')
+        soaphandler.wsdl_path = path
+        self.addCleanup(setattr, soaphandler, 'wsdl_path', None)
+        self.assertEqual(self.fetch('/MathService?wsdl').body, b'<definitions name="first"/>')
+
+        # the file is read again when its modification time changes
+        with open(path, 'wb') as fd:
+            fd.write(b'<definitions name="second"/>')
+        mtime = os.path.getmtime(path) + 10
+        os.utime(path, (mtime, mtime))
+        self.assertEqual(self.fetch('/MathService?wsdl').body, b'<definitions name="second"/>')
+
+    def test_not_wsdl_query(self):
+        response = self.fetch('/MathService?xsd')
+        self.assertEqual(response.code, 200)
+        self.assertEqual(response.body, b'')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+#
+# Copyright 2011 Rodrigo Ancavil del Pino
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+""" Thin adapter for the ElementTree API used by tornadows. It uses lxml.etree
+    when it is installed and xml.etree.ElementTree otherwise.
+"""
+from __future__ import unicode_literals
+
+try:
+    from lxml import etree
+    LXML = True
+except ImportError:
+    import xml.etree.ElementTree as etree
+    LXML = False
+
+SOAPENV_NS = 'http://schemas.xmlsoap.org/soap/envelope/'
+XSI_NS = 'http://www.w3.org/2001/XMLSchema-instance'
+
+""" Prefixes used to serialize the soap envelopes """
+NAMESPACES = {'soapenv': SOAPENV_NS, 'xsi': XSI_NS}
+
+if LXML:
+    # the parser is shared by all the requests, the entities are not resolved
+    # (xxe) and the blank text and comments between elements are not kept
+    _parser = etree.XMLParser(
+        resolve_entities=False,
+        remove_blank_text=True,
+        remove_comments=True,
+        huge_tree=False,
+        collect_ids=False,
+    )
+else:
+    _parser = None
+    for _prefix, _uri in NAMESPACES.items():
+        etree.register_namespace(_prefix, _uri)
+
+
+def qname(namespace, tag):
+    """ Return the tag name of an element in the namespace, in ElementTree notation """
+    if namespace:
+        return '{%s}%s' % (namespace, tag)
+    return tag
+
+
+def namespace(element):
+    """ Return the namespace of the element or None """
+    tag = element.tag
+    if tag[:1] == '{':
+        return tag[1:tag.index('}')]
+    return None
+
+
+def localname(element):
+    """ Return the tag name of the element without the namespace """
+    return element.tag.rpartition('}')[2]
+
+
+def Element(tag, nsmap=None):
+    """ Create an element, nsmap is a dictionary {prefix: uri} with the namespaces
+        declared in the element (ElementTree declares them when are used).
+     """
+    if LXML:
+        return etree.Element(tag, nsmap=nsmap)
+    return etree.Element(tag)
+
+
+SubElement = etree.SubElement
+
+
+def parse(data):
+    """ Parse a xml document from a bytes or str object, return the root element """
+    if LXML and isinstance(data, str) and data.startswith('<?xml'):
+        # lxml refuses a str with an encoding declaration, the str is already decoded
+        data = data[data.index('?>') + 2:]
+    return etree.fromstring(data, _parser)
+
+
+def tostring(element, declaration=False):
+    """ Serialize the element as utf-8 encoded bytes """
+    return etree.tostring(element, encoding='utf-8', xml_declaration=declaration)
+
+
+def children(element):
+    """ Return a list with the child elements, without comments and processing instructions """
+    return [child for child in element if isinstance(child.tag, str)]
+
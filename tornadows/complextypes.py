@@ -48,15 +48,22 @@ from builtins import object
 import tornadows.xmltypes
 import xml.dom.minidom
 import inspect
+import functools
+from tornadows import _xml
+
+# Attributes that every python class has, they are not part of a ComplexType
+_DEFAULT_ATTRS = frozenset(dir(type('default', (object, ), {})))
 
 
 class Property(object):
     """ Class base for definition of properties of the attributes of a python class """
-    pass
+    __slots__ = ('type', 'value')
 
 
 class IntegerProperty(Property):
     """ Class for definitions of Integer Property """
+    __slots__ = ()
+
     def __init__(self):
         self.type = tornadows.xmltypes.Integer
         self.value = None
@@ -64,6 +71,8 @@ class IntegerProperty(Property):
 
 class DecimalProperty(Property):
     """ Class for definitions of Decimal Property """
+    __slots__ = ()
+
     def __init__(self):
         self.type = tornadows.xmltypes.Decimal
         self.value = None
@@ -71,6 +80,8 @@ class DecimalProperty(Property):
 
 class DoubleProperty(Property):
     """ Class for definitions of Double Property """
+    __slots__ = ()
+
     def __init__(self):
         self.type = tornadows.xmltypes.Double
         self.value = None
@@ -78,6 +89,8 @@ class DoubleProperty(Property):
 
 class FloatProperty(Property):
     """ Class for definitions of Float Property """
+    __slots__ = ()
+
     def __init__(self):
         self.type = tornadows.xmltypes.Float
         self.value = None
@@ -85,6 +98,8 @@ class FloatProperty(Property):
 
 class DurationProperty(Property):
     """ Class for definitions of Duration Property """
+    __slots__ = ()
+
     def __init__(self):
         self.type = tornadows.xmltypes.Duration
         self.value = None
@@ -92,6 +107,8 @@ class DurationProperty(Property):
 
 class DateProperty(Property):
     """ Class for definitions of Date Property """
+    __slots__ = ()
+
     def __init__(self):
         self.type = tornadows.xmltypes.Date
         self.value = None
@@ -99,6 +116,8 @@ class DateProperty(Property):
 
 class TimeProperty(Property):
     """ Class for definitions of Time Property """
+    __slots__ = ()
+
     def __init__(self):
         self.type = tornadows.xmltypes.Time
         self.value = None
@@ -106,6 +125,8 @@ class TimeProperty(Property):
 
 class DateTimeProperty(Property):
     """ Class for definitions of DateTime Property """
+    __slots__ = ()
+
     def __init__(self):
         self.type = tornadows.xmltypes.DateTime
         self.value = None
@@ -113,6 +134,8 @@ class DateTimeProperty(Property):
 
 class StringProperty(Property):
     """ Class for definitions of String Property """
+    __slots__ = ()
+
     def __init__(self):
         self.type = tornadows.xmltypes.String
         self.value = None
@@ -120,16 +143,84 @@ class StringProperty(Property):
 
 class BooleanProperty(Property):
     """ Class for definitions of Boolean Property """
+    __slots__ = ()
+
     def __init__(self):
         self.type = tornadows.xmltypes.Boolean
         self.value = None
 
 
+# Types of the attributes for each kind of Property
+_PROPERTY_TYPES = {
+    IntegerProperty: tornadows.xmltypes.Integer,
+    DecimalProperty: tornadows.xmltypes.Decimal,
+    DoubleProperty: tornadows.xmltypes.Double,
+    FloatProperty: tornadows.xmltypes.Float,
+    DurationProperty: tornadows.xmltypes.Duration,
+    DateProperty: tornadows.xmltypes.Date,
+    TimeProperty: tornadows.xmltypes.Time,
+    DateTimeProperty: tornadows.xmltypes.DateTime,
+    StringProperty: tornadows.xmltypes.String,
+    BooleanProperty: tornadows.xmltypes.Boolean,
+}
+
+# Python types used for the attributes defined with the name of a type
+_PYTHON_TYPES = {
+    'int': int,
+    'decimal': float,
+    'double': float,
+    'float': float,
+    'duration': str,
+    'date': str,
+    'time': str,
+    'datetime': str,
+    'str': str,
+    'bool': bool,
+}
+
+
+# Conversion of the values of the elements with a xml primitive type
+_XSD_CONVERSIONS = {
+    'xsd:integer': int,
+    'xsd:decimal': float,
+    'xsd:double': float,
+    'xsd:float': float,
+    'xsd:duration': str,
+    'xsd:date': str,
+    'xsd:time': str,
+    'xsd:datetime': str,
+    'xsd:string': str,
+    'xsd:boolean': str,
+}
+
+# Xml primitive types of the elements in a schema
+_XSD_SCALAR_TYPES = frozenset(_XSD_CONVERSIONS)
+
+# Xml primitive type for each python type name
+_PYTHON2XML_TYPES = {
+    'int': 'integer',
+    'decimal': 'decimal',
+    'double': 'float',
+    'float': 'float',
+    'duration': 'duration',
+    'date': 'date',
+    'time': 'time',
+    'datetime': 'datetime',
+    'str': 'string',
+    'boolean': 'boolean',
+}
+
+
 class ArrayProperty(list):
-    """ For create a list of classes """
+    """ For create a list of classes.
 
-    def __init__(self, object, minOccurs=1, maxOccurs=None, data=[]):
-        list.__init__(self, data)
+        The class of the elements (object) is appended at the end of the
+        list, for a plain ArrayProperty(object) it is the first item, which
+        is where ComplexType reads the type of the elements of a list.
+    """
+
+    def __init__(self, object, minOccurs=1, maxOccurs=None, data=None):
+        list.__init__(self, () if data is None else data)
         self._minOccurs = minOccurs
         self._maxOccurs = maxOccurs
         self._object = object
@@ -137,16 +228,16 @@ class ArrayProperty(list):
 
     def toXSD(self, namespace='xsd', nameelement=None):
         """ Create xml complex type for ArrayProperty """
-        xsd = self._object.toXSD()
+        xsd = [self._object.toXSD()]
+        name = self._object.getName()
         if self._maxOccurs is None:
-            xsd += '<%s:element name="%s" type="tns:%s" minOccurs="%s"/>' % (
-                namespace, nameelement, self._object.getName(), self._minOccurs
-            )
+            xsd.append(f'<{namespace}:element name="{nameelement}" type="tns:{name}" minOccurs="{self._minOccurs}"/>')
         elif self._maxOccurs is not None:
-            xsd += '<%s:element name="%s" type="tns:%s" minOccurs="%s" maxOccurs="%s"/>' % (
-                namespace, nameelement, self._object.getName(), str(self._minOccurs), str(self._maxOccurs)
+            xsd.append(
+                f'<{namespace}:element name="{nameelement}" type="tns:{name}" '
+                f'minOccurs="{self._minOccurs}" maxOccurs="{self._maxOccurs}"/>'
             )
-        return xsd
+        return ''.join(xsd)
 
 
 class ComplexType(object):
@@ -189,16 +280,36 @@ class ComplexType(object):
         print p.toXML()
 
     """
+    _fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """ Classifies the attributes of the class only once, when it is defined.
+            cls._fields is a tuple of _Field objects sorted by name, see
+            _classifyAttribute().
+         """
+        super().__init_subclass__(**kwargs)
+        fields = []
+        for attr, element in cls.__dict__.items():
+            if attr in _DEFAULT_ATTRS or inspect.isroutine(element):
+                continue
+            field = _classifyAttribute(attr, element)
+            if field is not None:
+                fields.append(field)
+        cls._fields = tuple(sorted(fields, key=lambda field: field.name))
+
     def __init__(self):
         """ Class constructor for ComplexType """
-        default_attr = dir(type('default', (object,), {}))
-        for attr in list(self.__class__.__dict__.keys()):
-            if default_attr.count(attr) > 0 or callable(attr):
-                continue
+        for field in self._fields:
+            kind = field.kind
+            if kind == 'property':
+                typeobj = type(field.type)()
+            elif kind == 'complex':
+                typeobj = field.type()
+            elif kind == 'array':
+                typeobj = list()
             else:
-                element = self.__class__.__dict__[attr]
-                typeobj = self._createAttributeType(element)
-                setattr(self, attr, typeobj)
+                typeobj = _PYTHON_TYPES.get(field.type.__name__)
+            setattr(self, field.name, typeobj)
 
     def toXML(self, name=None):
         """ Method that creates the XML document for the instance of python class.
@@ -211,97 +322,100 @@ class ComplexType(object):
         else:
             nameroot = name
 
-        xml = '<%s>' % nameroot
-        default_attr = dir(type('default', (object, ), {}))
-        for key in dir(self):
-            if default_attr.count(key) > 0:
-                continue
-            element = findElementFromDict(self.__dict__, key)
+        xml = [f'<{nameroot}>']
+        for field, value in self._iterElements():
+            if isinstance(value, ComplexType):
+                xml.append(value.toXML(name=field.name))
+            else:
+                xml.extend((field.open, value, field.close))
+        xml.append(f'</{nameroot}>')
+        return ''.join(xml)
+
+    def toElement(self, name=None):
+        """ Method that creates the xml element for the instance of python class,
+            with the same content as toXML(). Return an Element, the text of the
+            values is escaped when it is serialized.
+         """
+        nameroot = self.__class__.__name__ if name is None else name
+        root = _xml.Element(nameroot)
+        SubElement = _xml.SubElement
+        for field, value in self._iterElements():
+            if isinstance(value, ComplexType):
+                root.append(value.toElement(name=field.name))
+            else:
+                SubElement(root, field.name).text = value
+        return root
+
+    def _iterElements(self):
+        """ Generator of the child elements of the instance, used by toXML() and
+            toElement(). Yields (field, value), value is a ComplexType instance or
+            the text of the element.
+         """
+        for field in self._fields:
+            element = self.__dict__.get(field.name)
             if element is None:
                 continue
             if isinstance(element, list):
                 for e in element:
-                    if isinstance(e, ComplexType):
-                        xml += e.toXML(name=key)
-                    else:
-                        xml += '<%s>%s</%s>' % (key, e, key)
+                    yield field, (e if isinstance(e, ComplexType) else str(e))
             elif isinstance(element, Property):
-                xml += '<%s>%s</%s>' % (key, element.value, key)
+                yield field, str(element.value)
             elif isinstance(element, ComplexType):
-                xml += element.toXML(name=key)
+                yield field, element
             else:
-                xml += '<%s>%s</%s>' % (key, element.decode() if type(element) is bytes else element, key)
-        xml += '</%s>' % nameroot
-        return xml
+                yield field, _renderText(element)
 
     @classmethod
     def toXSD(cls, xmlns='http://www.w3.org/2001/XMLSchema', namespace='xsd'):
         """ Class method that creates the XSD document for the python class.
             Return a string with the xml schema.
-         """
-        name = cls.__name__
-        xsd = cls._generateXSD()
-        xsd += '<%s:element name="%s" type="tns:%s"/>' % (namespace, name, name)
 
-        return xsd
+            The schema only depends on the class definition, so it is cached
+            per class, xmlns and namespace. The attributes of a ComplexType
+            are classified once, when the class is defined (cls._fields), so
+            changing them later is not supported and clearing the caches
+            does not make the changes visible.
+         """
+        return _toXSD(cls, xmlns, namespace)
 
     @classmethod
     def _generateXSD(cls, xmlns='http://www.w3.org/2001/XMLSchema', namespace='xsd'):
         """ Class method for get the xml schema with the document definition.
-            Return a string with the xsd document.
+            Return a string with the xsd document, cached by class, xmlns
+            and namespace.
          """
-        default_attr = dir(type('default', (object, ), {}))
+        return _generateXSD(cls, xmlns, namespace)
+
+    @classmethod
+    def _createXSDParts(cls, xmlns, namespace):
+        """ Class method that returns a list with the fragments of the xml schema """
         name = cls.__name__
-        xsd = '<%s:complexType name="%s" xmlns:%s="%s">' % (namespace, name, namespace, xmlns)
-        xsd += '<%s:sequence>' % namespace
+        xsd = [f'<{namespace}:complexType name="{name}" xmlns:{namespace}="{xmlns}">', f'<{namespace}:sequence>']
         complextype = []
-        for key in dir(cls):
-            if default_attr.count(key) > 0:
-                continue
-            element = findElementFromDict(cls.__dict__, key)
-            if element is None:
-                continue
-            if isinstance(element, Property):
-                xsd += element.type.createElement(str(key))
-            elif isinstance(element, ComplexType):
-                nameinstance = key
-                complextype.append(element._generateXSD())
-                xsd += '<%s:element name="%s" type="tns:%s"/>' % (namespace, nameinstance, element.getName())
-            elif inspect.isclass(element) and issubclass(element, ComplexType):
-                nameinstance = key
-                complextype.append(element._generateXSD())
-                xsd += '<%s:element name="%s" type="tns:%s"/>' % (namespace, nameinstance, element.getName())
-            elif isinstance(element, ArrayProperty):
-                if isinstance(element[0], ComplexType) or issubclass(element[0], ComplexType):
-                    complextype.append(element[0]._generateXSD())
-                    xsd += '<%s:element name="%s" type="tns:%s" maxOccurs="unbounded"/>' % (
-                        namespace, key, element[0].__name__
-                    )
-                else:
-                    typeelement = createPythonType2XMLType(element[0].__name__)
-                    xsd += '<%s:element name="%s" type="%s:%s" maxOccurs="unbounded"/>' % (
-                        namespace, key, namespace, typeelement
-                    )
-            elif isinstance(element, list):
-                if isinstance(element[0], ComplexType) or issubclass(element[0], ComplexType):
-                    complextype.append(element[0]._generateXSD())
-                    xsd += '<%s:element name="%s" type="tns:%s" maxOccurs="unbounded"/>' % (
-                        namespace, key, element[0].__name__
+        for field in cls._fields:
+            kind, key, typ = field.kind, field.name, field.type
+            if kind == 'property':
+                xsd.append(typ.type.createElement(key))
+            elif kind == 'complex':
+                complextype.append(typ._generateXSD())
+                xsd.append(f'<{namespace}:element name="{key}" type="tns:{typ.getName()}"/>')
+            elif kind == 'array':
+                if issubclass(typ, ComplexType):
+                    complextype.append(typ._generateXSD())
+                    xsd.append(
+                        f'<{namespace}:element name="{key}" type="tns:{typ.__name__}" maxOccurs="unbounded"/>'
                     )
                 else:
-                    typeelement = createPythonType2XMLType(element[0].__name__)
-                    xsd += '<%s:element name="%s" type="%s:%s" maxOccurs="unbounded"/>' % (
-                        namespace, key, namespace, typeelement
+                    typeelement = createPythonType2XMLType(typ.__name__)
+                    xsd.append(
+                        f'<{namespace}:element name="{key}" type="{namespace}:{typeelement}" maxOccurs="unbounded"/>'
                     )
-            elif hasattr(element, '__name__'):
-                typeelement = createPythonType2XMLType(element.__name__)
-                xsd += '<%s:element name="%s" type="%s:%s"/>' % (namespace, str(key), namespace, typeelement)
-        xsd += '</%s:sequence>' % namespace
-        xsd += '</%s:complexType>' % namespace
-
-        if len(complextype) > 0:
-            for ct in complextype:
-                xsd += ct
+            else:
+                typeelement = createPythonType2XMLType(typ.__name__)
+                xsd.append(f'<{namespace}:element name="{key}" type="{namespace}:{typeelement}"/>')
+        xsd.append(f'</{namespace}:sequence>')
+        xsd.append(f'</{namespace}:complexType>')
+        xsd.extend(complextype)
 
         return xsd
 
@@ -310,251 +424,202 @@ class ComplexType(object):
         """ Class method return the name of the class """
         return cls.__name__
 
-    @classmethod
-    def _createAttributeType(self, element):
-        """ Class method to create the types of the attributes of a ComplexType """
-        if isinstance(element, list):
-            return list()
-        elif isinstance(element, IntegerProperty):
-            return IntegerProperty()
-        elif isinstance(element, DecimalProperty):
-            return DecimalProperty()
-        elif isinstance(element, DoubleProperty):
-            return DoubleProperty()
-        elif isinstance(element, FloatProperty):
-            return FloatProperty()
-        elif isinstance(element, DurationProperty):
-            return DurationProperty()
-        elif isinstance(element, DateProperty):
-            return DateProperty()
-        elif isinstance(element, TimeProperty):
-            return TimeProperty()
-        elif isinstance(element, DateTimeProperty):
-            return DateTimeProperty()
-        elif isinstance(element, StringProperty):
-            return StringProperty()
-        elif isinstance(element, BooleanProperty):
-            return BooleanProperty()
-        elif issubclass(element, ComplexType):
-            return element()
-        else:
-            if element.__name__ == 'int':
-                return int
-            elif element.__name__ == 'decimal':
-                return float
-            elif element.__name__ == 'double':
-                return float
-            elif element.__name__ == 'float':
-                return float
-            elif element.__name__ == 'duration':
-                return str
-            elif element.__name__ == 'date':
-                return str
-            elif element.__name__ == 'time':
-                return str
-            elif element.__name__ == 'datetime':
-                return str
-            elif element.__name__ == 'str':
-                return str
-            elif element.__name__ == 'bool':
-                return bool
+
+@functools.lru_cache(maxsize=None)
+def _toXSD(cls, xmlns, namespace):
+    """ Function that creates the xml schema of ComplexType.toXSD() """
+    name = cls.__name__
+    return f'{cls._generateXSD()}<{namespace}:element name="{name}" type="tns:{name}"/>'
+
+
+@functools.lru_cache(maxsize=None)
+def _generateXSD(cls, xmlns, namespace):
+    """ Function that creates the xml schema of ComplexType._generateXSD() """
+    return ''.join(cls._createXSDParts(xmlns, namespace))
+
+
+def _renderText(value):
+    """ Function that returns the text of a value for the xml document. The type
+        declared for an attribute is only a hint, the value can be of any type.
+     """
+    return value.decode() if type(value) is bytes else str(value)
+
+
+class _Field(object):
+    """ Attribute of a ComplexType class, with the tags used for the xml document """
+    __slots__ = ('kind', 'name', 'type', 'open', 'close')
+
+    def __init__(self, kind, name, type):
+        self.kind = kind
+        self.name = name
+        self.type = type
+        self.open = f'<{name}>'
+        self.close = f'</{name}>'
+
+
+def _classifyAttribute(name, element):
+    """ Function that classifies an attribute of a ComplexType class.
+        Return a _Field(kind, name, type) where kind is one of:
+
+            'property' : type is the Property instance of the definition.
+            'complex'  : type is the ComplexType class.
+            'array'    : type is the class of the elements of the list (str for an empty list).
+            'scalar'   : type is the python type.
+
+        or None if the attribute isn't an element of the type.
+     """
+    if isinstance(element, Property):
+        return _Field('property', name, element)
+    elif isinstance(element, ComplexType):
+        return _Field('complex', name, type(element))
+    elif inspect.isclass(element) and issubclass(element, ComplexType):
+        return _Field('complex', name, element)
+    elif isinstance(element, list):
+        if not element:
+            # a list without the type of its elements, like tags = [], is a list of str
+            return _Field('array', name, str)
+        item = element[0]
+        return _Field('array', name, item if inspect.isclass(item) else type(item))
+    elif hasattr(element, '__name__'):
+        return _Field('scalar', name, element)
+    return None
 
 
 def xml2object(xml, xsd, complex):
-    """ Function that converts a XML document in a instance of a python class """
+    """ Function that converts a XML document in a instance of a python class.
+        xml is a string or an Element, which is used without parse it again.
+        xsd is the xml schema as xml.dom.minidom.Document or as a string, the
+        dictionary of types for a string is cached.
+     """
     namecls = complex.getName()
-    types = xsd2dict(xsd)
+    if isinstance(xsd, str):
+        types = xsdstring2dict(xsd)
+    else:
+        types = xsd2dict(xsd)
     lst = xml2list(xml, namecls, types)
     tps = cls2dict(complex)
-    obj = generateOBJ(lst, namecls, tps)
+    obj = generateOBJ(lst, complex, tps)
     return obj
 
 
+@functools.lru_cache(maxsize=None)
 def cls2dict(complex):
-    """ Function that creates a dictionary from a ComplexType class with the attributes and types """
-    default_attr = dir(type('default', (object, ), {}))
+    """ Function that creates a dictionary from a ComplexType class with the attributes and types.
+        The result is cached by class and must not be modified.
+     """
     dct = {}
-    for attr in dir(complex):
-        if default_attr.count(attr) > 0 or callable(attr):
-            continue
-        else:
-            elem = findElementFromDict(complex.__dict__, attr)
-            if elem is not None:
-                dct[attr] = elem
+    attributes = vars(complex)
+    for field in complex._fields:
+        dct[field.name] = attributes[field.name]
     return dct
 
 
 def xsd2dict(xsd, namespace='xsd'):
     """ Function that creates a dictionary from a xml schema with the type of element """
-    types = [
-        'xsd:integer',
-        'xsd:decimal',
-        'xsd:double',
-        'xsd:float',
-        'xsd:duration',
-        'xsd:date',
-        'xsd:time',
-        'xsd:datetime',
-        'xsd:string',
-        'xsd:boolean',
-    ]
     dct = {}
     element = '%s:element' % namespace
     elems = xsd.getElementsByTagName(element)
     for e in elems:
         val = 'complexType'
-        typ = str(e.getAttribute('type'))
-        if types.count(typ) > 0:
+        typ = e.getAttribute('type')
+        if typ in _XSD_SCALAR_TYPES:
             val = 'element'
-        dct[str(e.getAttribute('name'))] = (val, typ)
+        dct[e.getAttribute('name')] = (val, typ)
     return dct
 
 
+@functools.lru_cache(maxsize=None)
+def xsdstring2dict(xsd, namespace='xsd'):
+    """ Function that creates a dictionary from a xml schema string with the type of element.
+        The result is cached by schema and must not be modified.
+     """
+    return xsd2dict(xml.dom.minidom.parseString(xsd), namespace)
+
+
 def xml2list(xmldoc, name, types):
-    """ Function that creates a list from xml documento with a tuple element and value """
-    x = xml.dom.minidom.parseString(xmldoc)
-    c = None
-    if x.documentElement.prefix is not None:
-        c = x.getElementsByTagName(x.documentElement.prefix + ':' + name)
+    """ Function that creates a list from xml documento (a string or an Element) with a tuple element and value """
+    if _xml.etree.iselement(xmldoc):
+        x = xmldoc
     else:
-        c = x.getElementsByTagName(name)
-    attrs = genattr(c)
+        x = _xml.parse(xmldoc)
+    namespace = ''
+    if x.tag.startswith('{'):
+        namespace = x.tag[:x.tag.index('}') + 1]
+    c = next(x.iter(namespace + name))
+    return node2list(c, types)
+
+
+def node2list(node, types):
+    """ Function that creates a list from a xml element with a tuple for each child element and value.
+        The child elements of a complexType are converted recursively, without parse them again.
+     """
     lst = []
-    for a in attrs:
-        t = types[a.nodeName]
-        typ = t[0]
-        typxml = t[1]
+    append = lst.append
+    # the child elements are not copied as genattr(), comments and processing instructions are skipped
+    for a in _xml.children(node):
+        nodename = _xml.localname(a)
+        typ, typxml = types[nodename]
         if typ == 'complexType' or typ == 'list':
-            lval = xml2list(a.toxml(), str(a.nodeName), types)
-            lst.append((str(a.nodeName), lval))
+            append((nodename, node2list(a, types)))
         else:
-            val = convert(typxml, str(a.childNodes[0].nodeValue))
-            lst.append((str(a.nodeName), val))
+            # xsd2dict only marks as element the types in _XSD_CONVERSIONS
+            text = a.text
+            append((nodename, _XSD_CONVERSIONS[typxml](text if text is not None else '')))
     return lst
 
 
-def generateOBJ(d, namecls, types):
-    """ Function that creates a Object from a xml document """
-    dct = {}
-    lst = []
-    for a in d:
-        name = a[0]
-        value = a[1]
+def generateOBJ(d, complex, types):
+    """ Function that creates an instance of the class complex from a xml document,
+        types is the dictionary with the attributes of complex (see cls2dict).
+     """
+    obj = complex()
+    for name, value in d:
+        typ = types.get(name)
+        element = typ[0] if isinstance(typ, list) else typ
         if isinstance(value, list):
-            o = generateOBJ(value, name, types)
-            lst.append(o)
-            dct[name] = lst
+            nested = element if inspect.isclass(element) else type(element)
+            value = generateOBJ(value, nested, cls2dict(nested))
+        elif isinstance(element, Property):
+            value = createProperty(element, value)
+        if isinstance(typ, list):
+            getattr(obj, name).append(value)
         else:
-            typ = findElementFromDict(types, name)
-            if isinstance(typ, Property):
-                dct[name] = createProperty(typ, value)
-            else:
-                dct[name] = value
-    return type(namecls, (ComplexType, ), dct)
+            setattr(obj, name, value)
+    return obj
 
 
 def createProperty(typ, value):
     """ Function that creates a Property class instance, with the value """
     ct = None
-    if isinstance(typ, IntegerProperty):
-        ct = IntegerProperty()
-        ct.value = tornadows.xmltypes.Integer.genType(value)
-    elif isinstance(typ, DecimalProperty):
-        ct = DecimalProperty()
-        ct.value = tornadows.xmltypes.Decimal.genType(value)
-    elif isinstance(typ, DoubleProperty):
-        ct = DoubleProperty()
-        ct.value = tornadows.xmltypes.Double.genType(value)
-    elif isinstance(typ, FloatProperty):
-        ct = FloatProperty()
-        ct.value = tornadows.xmltypes.Float.genType(value)
-    elif isinstance(typ, DurationProperty):
-        ct = DurationProperty()
-        ct.value = tornadows.xmltypes.Duration.genType(value)
-    elif isinstance(typ, DateProperty):
-        ct = DateProperty()
-        ct.value = tornadows.xmltypes.Date.genType(value)
-    elif isinstance(typ, TimeProperty):
-        ct = TimeProperty()
-        ct.value = tornadows.xmltypes.Time.genType(value)
-    elif isinstance(typ, DateTimeProperty):
-        ct = DateTimeProperty()
-        ct.value = tornadows.xmltypes.DateTime.genType(value)
-    elif isinstance(typ, StringProperty):
-        ct = StringProperty()
-        ct.value = tornadows.xmltypes.String.genType(value)
-    elif isinstance(typ, BooleanProperty):
-        ct = BooleanProperty()
-        ct.value = tornadows.xmltypes.Boolean.genType(value)
+    cls = type(typ)
+    xmltype = _PROPERTY_TYPES.get(cls)
+    if xmltype is not None:
+        ct = cls()
+        ct.value = xmltype.genType(value)
+    elif isinstance(typ, Property):
+        ct = cls()
+        ct.value = ct.type.genType(value)
 
     return ct
 
 
-def genattr(elems):
+def genattr(element):
     """ Function that generates a list with de nodes child of a xml element  """
-    d = []
-    for e in elems[0].childNodes:
-        if e.nodeType == e.ELEMENT_NODE:
-            d.append(e)
-    return d
+    return list(element)
 
 
 def findElementFromDict(dictionary, key):
     """ Function to find a element into a dictionary for the key """
-    element = None
-    try:
-        element = dictionary[key]
-        return element
-    except KeyError:
-        return None
+    return dictionary.get(key)
 
 
 def convert(typeelement, value):
     """ Function that converts a value depending his type """
-    if typeelement == 'xsd:integer':
-        return int(value)
-    elif typeelement == 'xsd:decimal':
-        return float(value)
-    elif typeelement == 'xsd:double':
-        return float(value)
-    elif typeelement == 'xsd:float':
-        return float(value)
-    elif typeelement == 'xsd:duration':
-        return str(value)
-    elif typeelement == 'xsd:date':
-        return str(value)
-    elif typeelement == 'xsd:time':
-        return str(value)
-    elif typeelement == 'xsd:datetime':
-        return str(value)
-    elif typeelement == 'xsd:string':
-        return str(value)
-    elif typeelement == 'xsd:boolean':
-        return str(value)
+    conversion = _XSD_CONVERSIONS.get(typeelement)
+    if conversion is not None:
+        return conversion(value)
 
 
 def createPythonType2XMLType(pyType):
     """ Function that creates a xml type from a python type """
-    xmlType = None
-    if pyType == 'int':
-        xmlType = 'integer'
-    elif pyType == 'decimal':
-        xmlType = 'decimal'
-    elif pyType == 'double':
-        xmlType = 'float'
-    elif pyType == 'float':
-        xmlType = 'float'
-    elif pyType == 'duration':
-        xmlType = 'duration'
-    elif pyType == 'date':
-        xmlType = 'date'
-    elif pyType == 'time':
-        xmlType = 'time'
-    elif pyType == 'datetime':
-        xmlType = 'datetime'
-    elif pyType == 'str':
-        xmlType = 'string'
-    elif pyType == 'boolean':
-        xmlType = 'boolean'
-
-    return xmlType
+    return _PYTHON2XML_TYPES.get(pyType)
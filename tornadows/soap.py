@@ -18,80 +18,71 @@
 from __future__ import unicode_literals
 
 from builtins import object
-import xml.dom.minidom
+from tornadows import _xml
 
 
 class SoapMessage(object):
-    """ Implementation of a envelope soap 1.1 with minidom API
+    """ Implementation of a envelope soap 1.1 with ElementTree API
 
         import tornadows.soap
-        import xml.dom.minidom
+        from tornadows import _xml
 
         soapenvelope = tornadows.soap.SoapMessage()
-        xmlDoc = xml.dom.minidom.parseString('<Doc>Hello, world!!!</Doc>')
+        xmlDoc = _xml.parse('<Doc>Hello, world!!!</Doc>')
         soapenvelope.setBody(xmlDoc)
         for s in soapenvelope.getBody():
-            print s.toxml()
+            print(_xml.tostring(s))
 
     """
     def __init__(self):
-        self._soap = xml.dom.minidom.Document()
-        envurl = 'http://schemas.xmlsoap.org/soap/envelope/'
-        self._envelope = self._soap.createElementNS(envurl, 'soapenv:Envelope')
-        self._envelope.setAttribute('xmlns:soapenv', envurl)
-        self._envelope.setAttribute('xmlns:xsi', "http://www.w3.org/2001/XMLSchema-instance")
-        self._envelope.setAttribute('xsi:schemaLocation', ' '.join((envurl, envurl)))
-        self._soap.appendChild(self._envelope)
-        self._header = self._soap.createElement('soapenv:Header')
-        self._body = self._soap.createElement('soapenv:Body')
-        self._envelope.appendChild(self._header)
-        self._envelope.appendChild(self._body)
+        envurl = _xml.SOAPENV_NS
+        self._soap = _xml.Element(_xml.qname(envurl, 'Envelope'), _xml.NAMESPACES)
+        self._soap.set(_xml.qname(_xml.XSI_NS, 'schemaLocation'), ' '.join((envurl, envurl)))
+        self._header = _xml.SubElement(self._soap, _xml.qname(envurl, 'Header'))
+        self._body = _xml.SubElement(self._soap, _xml.qname(envurl, 'Body'))
 
     def getSoap(self):
-        """ Return the soap envelope as xml.dom.minidom.Document
-            getSoap() return a xml.dom.minidom.Document object
+        """ Return the soap envelope as an Element
+            getSoap() return the Envelope element, serialize it with _xml.tostring()
         """
         return self._soap
 
     def getHeader(self):
         """ Return the child elements of Header element
-            getHeader() return a list with xml.dom.minidom.Element objects
+            getHeader() return a list with Element objects
         """
-        return self._header.childNodes
+        return list(self._header)
 
     def getBody(self):
         """ Return the child elements of Body element
-            getBody() return a list with xml.dom.minidom.Element objects
+            getBody() return a list with Element objects
         """
-        return self._body.childNodes
+        return list(self._body)
 
     def setHeader(self, header):
         """ Set the child content to Header element
-            setHeader(header), header is a xml.dom.minidom.Document object
+            setHeader(header), header is an Element or an ElementTree object
          """
-        if isinstance(header, xml.dom.minidom.Document):
-            self._header.appendChild(header.documentElement)
-        elif isinstance(header, xml.dom.minidom.Element):
-            self._header.appendChild(header)
+        if _xml.etree.iselement(header):
+            self._header.append(header)
+        elif hasattr(header, 'getroot'):
+            self._header.append(header.getroot())
 
     def setBody(self, body):
         """ Set the child content to Body element
-            setBody(body), body is a xml.dom.minidom.Document object or
-            a xml.dom.minidom.Element
+            setBody(body), body is an Element or an ElementTree object
         """
-        if isinstance(body, xml.dom.minidom.Document):
-            self._body.appendChild(body.documentElement)
-        elif isinstance(body, xml.dom.minidom.Element):
-            self._body.appendChild(body)
+        if _xml.etree.iselement(body):
+            self._body.append(body)
+        elif hasattr(body, 'getroot'):
+            self._body.append(body.getroot())
 
     def removeHeader(self):
         """ Remove the last child elements from Header element """
-        lastElement = self._header.lastChild
-        if lastElement is not None:
-            self._header.removeChild(lastElement)
+        if len(self._header):
+            self._header.remove(self._header[-1])
 
     def removeBody(self):
         """ Remove last child elements from Body element """
-        lastElement = self._body.lastChild
-        if lastElement is not None:
-            self._body.removeChild(lastElement)
+        if len(self._body):
+            self._body.remove(self._body[-1])
@@ -19,9 +19,13 @@ from __future__ import unicode_literals
 
 from builtins import str
 import tornado.httpserver
+import tornado.ioloop
 import tornado.web
-import xml.dom.minidom
+import collections
+import functools
 import inspect
+import os
+from tornadows import _xml
 from tornadows import soap
 from tornadows import xmltypes
 from tornadows import complextypes
@@ -30,6 +34,49 @@ from tornadows import wsdl
 """ Global variable. If you want use your own wsdl file """
 wsdl_path = None
 
+""" Table for bytes.translate(), the newlines and tabs of the requests are parsed as spaces """
+_WHITESPACE = bytes.maketrans(b'\n\t\r', b'   ')
+
+
+# A web service operator, made by the decorator webservice. It keeps the metadata
+# of the operator in slots, with the decode and encode functions specialized to its
+# types by _createDecoder() and _createEncoder(). As a descriptor it returns the
+# function fn bound to the handler, there is no wrapper to call by request.
+# __name__, __doc__ and __wrapped__ are the ones of fn.
+class _SoapOp(object):
+    __slots__ = ('fn', 'name', 'args', 'input', 'output', 'inputArray', 'outputArray', 'decode', 'encode')
+
+    def __init__(self, fn, args, input, output, inputArray, outputArray):
+        self.fn = fn
+        self.name = fn.__name__
+        self.args = args
+        self.input = input
+        self.output = output
+        self.inputArray = inputArray
+        self.outputArray = outputArray
+        self.decode = _createDecoder(input, args, inputArray)
+        self.encode = _createEncoder(output, outputArray)
+
+    @property
+    def __name__(self):
+        return self.fn.__name__
+
+    @property
+    def __doc__(self):
+        return self.fn.__doc__
+
+    @property
+    def __wrapped__(self):
+        return self.fn
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return self.fn.__get__(instance, owner)
+
+    def __call__(self, *args, **kwargs):
+        return self.fn(*args, **kwargs)
+
 
 def webservice(*params, **kwparams):
     """ Decorator method for web services operators """
@@ -41,18 +88,18 @@ def webservice(*params, **kwparams):
         _args = None
         if len(kwparams):
             _params = kwparams['_params']
+            # the names of the arguments (without self), as getfullargspec(f).args[1:]
+            code = f.__code__
+            _args = list(code.co_varnames[1:code.co_argcount])
             if inspect.isclass(_params) and issubclass(_params, complextypes.ComplexType):
-                _args = inspect.getfullargspec(f).args[1:]
                 _input = _params
             elif isinstance(_params, list):
-                _args = inspect.getfullargspec(f).args[1:]
                 _input = {}
                 i = 0
                 for arg in _args:
                     _input[arg] = _params[i]
                     i += 1
             else:
-                _args = inspect.getfullargspec(f).args[1:]
                 _input = {}
                 for arg in _args:
                     _input[arg] = _params
@@ -66,32 +113,108 @@ def webservice(*params, **kwparams):
             elif isinstance(_returns, list) or issubclass(_returns, xmltypes.PrimitiveType) or issubclass(_returns, complextypes.ComplexType):
                 _output = _returns
 
-        def operation(*args, **kwargs):
-            return f(*args, **kwargs)
-
-        operation.__name__ = f.__name__
-        operation._is_operation = True
-        operation._args = _args
-        operation._input = _input
-        operation._output = _output
-        operation._operation = f.__name__
-        operation._inputArray = _inputArray
-        operation._outputArray = _outputArray
-        return operation
+        return _SoapOp(f, _args, _input, _output, _inputArray, _outputArray)
     return method
 
 
+@functools.lru_cache(maxsize=None)
+def _xsdFor(complex):
+    """ Return the xml schema of the class complex as a string, it is built once by class.
+        The same string is reused, so xml2object() finds its dictionary of types by a lookup.
+     """
+    return '<xsd:schema xmlns:xsd="http://www.w3.org/2001/XMLSchema">%s</xsd:schema>' % complex.toXSD()
+
+
+@functools.lru_cache(maxsize=None)
+def _hostAddress():
+    """ Return the address of the host, it is resolved only once, when the first wsdl is generated """
+    return tornado.httpserver.socket.gethostbyname(tornado.httpserver.socket.gethostname())
+
+
+@functools.lru_cache(maxsize=64)
+def _createWsdl(handler, address, port, nameservice):
+    """ Return the WSDL of the class handler as bytes. The port and the name of
+        the service come from the request (Host header and uri), so the cache
+        is bounded.
+     """
+    wsdl_input = None
+    wsdl_output = None
+    wsdl_operation = None
+    wsdl_args = None
+
+    # the wsdl describes the last operator, by name
+    operations = handler._soap_operations
+    if operations:
+        operation = operations[len(operations) - 1]
+        wsdl_input = operation.input
+        wsdl_output = operation.output
+        wsdl_operation = operation.name
+        wsdl_args = operation.args
+
+    wsdl_targetns = 'http://%s:%s/%s/%s' % (address, port, nameservice, wsdl_operation)
+    wsdl_location = 'http://%s:%s/%s' % (address, port, nameservice)
+    wsdlfile = wsdl.Wsdl(
+        nameservice=nameservice,
+        targetNamespace=wsdl_targetns,
+        arguments=wsdl_args,
+        elementInput=('params', wsdl_input),
+        elementOutput=('returns', wsdl_output),
+        operation=wsdl_operation,
+        location=wsdl_location
+    )
+    return wsdlfile.createWsdl()
+
+
+@functools.lru_cache(maxsize=16)
+def _readWsdlFile(path, mtime):
+    """ Return the contents of the wsdl file in path as bytes, cached by path and
+        modification time (mtime is only part of the key).
+     """
+    with open(path, 'rb') as fd:
+        return fd.read()
+
+
+def _createDecoder(typesinput, args, inputArray):
+    """ Return a function decode(handler, body) that returns the positional arguments
+        of an operator from the Body element, the type of the input is checked only once.
+     """
+    if inspect.isclass(typesinput) and issubclass(typesinput, complextypes.ComplexType):
+        def decode(handler, body):
+            return (handler._parseComplexType(typesinput, body), )
+    elif inputArray:
+        def decode(handler, body):
+            return (handler._parseParams(body, typesinput, args), )
+    else:
+        def decode(handler, body):
+            return handler._parseParams(body, typesinput, args)
+    return decode
+
+
+def _createEncoder(typesoutput, outputArray):
+    """ Return a function encode(handler, response) that returns the SoapMessage
+        with the response of an operator, the type of the output is checked only once.
+     """
+    if inspect.isclass(typesoutput) and issubclass(typesoutput, complextypes.ComplexType):
+        def encode(handler, response):
+            return handler._createReturnsComplexType(response)
+    else:
+        is_array = outputArray or None
+
+        def encode(handler, response):
+            return handler._createReturns(response, is_array)
+    return encode
+
+
 def soapfault(faultstring):
     """ Method for generate a soap fault
         soapfault() return a SoapMessage() object with a message
         for Soap Envelope
      """
     fault = soap.SoapMessage()
-    faultmsg = '<soapenv:Fault xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope">\n'
-    faultmsg += '<faultcode></faultcode>\n'
-    faultmsg += '<faultstring>%s</faultstring>\n' % faultstring
-    faultmsg += '</soapenv:Fault>\n'
-    fault.setBody(xml.dom.minidom.parseString(faultmsg))
+    faultmsg = _xml.Element(_xml.qname(_xml.SOAPENV_NS, 'Fault'))
+    _xml.SubElement(faultmsg, 'faultcode')
+    _xml.SubElement(faultmsg, 'faultstring').text = faultstring
+    fault.setBody(faultmsg)
     return fault
 
 
@@ -99,107 +222,100 @@ class SoapHandler(tornado.web.RequestHandler):
     """ This subclass extends tornado.web.RequestHandler class, defining the
         methods get() and post() for handle a soap message (request and response).
     """
-    def get(self):
+    _soap_operations = ()
+    _soap_operations_by_name = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """ Finds the web services operators of the class only once, when it
+            is defined. cls._soap_operations is a tuple with the _SoapOp of
+            each operator, sorted by the name of the attribute.
+        """
+        super().__init_subclass__(**kwargs)
+        operations = {}
+        for klass in reversed(cls.__mro__):
+            for name, operation in vars(klass).items():
+                if isinstance(operation, _SoapOp):
+                    operations[name] = operation
+                elif name in operations:
+                    # overridden by an attribute that isn't an operator
+                    del operations[name]
+        cls._soap_operations = tuple(operations[name] for name in sorted(operations))
+        # post() finds the operator by the name of the first child of Body, it can
+        # be the element of the input (as in the wsdl) or the name of the operator
+        byname = {}
+        for operation in cls._soap_operations:
+            typesinput = operation.input
+            if inspect.isclass(typesinput) and issubclass(typesinput, complextypes.ComplexType):
+                byname[typesinput.getName()] = operation
+            else:
+                byname['params'] = operation
+        for operation in cls._soap_operations:
+            byname[operation.name] = operation
+        cls._soap_operations_by_name = byname
+
+    async def get(self):
         """ Method get() returned the WSDL. If wsdl_path is null, the
-            WSDL is generated dinamically.
+            WSDL is generated dinamically, else the file is read in the
+            default executor, without block the IOLoop.
+
+            The WSDL generated is cached by handler class, address, port and
+            name of the service, see _createWsdl().
         """
-        address = getattr(
-            self,
-            'targetns_address',
-            tornado.httpserver.socket.gethostbyname(tornado.httpserver.socket.gethostname()),
-        )
-        port = self.request.headers['Host'].split(':')[1]
-        wsdl_nameservice = self.request.uri.replace('/', '').replace('?wsdl', '').replace('?WSDL', '')
-        wsdl_input = None
-        wsdl_output = None
-        wsdl_operation = None
-        wsdl_args = None
-
-        for operations in dir(self):
-            operation = getattr(self, operations)
-            if callable(operation) and hasattr(operation, '_input') and hasattr(operation, '_output') and hasattr(operation, '_operation') \
-                    and hasattr(operation, '_args'):
-                wsdl_input = getattr(operation, '_input')
-                wsdl_output = getattr(operation, '_output')
-                wsdl_operation = getattr(operation, '_operation')
-                wsdl_args = getattr(operation, '_args')
-
-        wsdl_targetns = 'http://%s:%s/%s/%s' % (address, port, wsdl_nameservice, wsdl_operation)
-        wsdl_location = 'http://%s:%s/%s' % (address, port, wsdl_nameservice)
         query = self.request.query
         self.set_header('Content-Type', 'application/xml; charset=UTF-8')
-        if query.upper() == 'WSDL':
-            if wsdl_path is None:
-                wsdlfile = wsdl.Wsdl(
-                    nameservice=wsdl_nameservice,
-                    targetNamespace=wsdl_targetns,
-                    arguments=wsdl_args,
-                    elementInput=('params', wsdl_input),
-                    elementOutput=('returns', wsdl_output),
-                    operation=wsdl_operation,
-                    location=wsdl_location
-                )
-                self.finish(wsdlfile.createWsdl().toxml())
-            else:
-                fd = open(str(wsdl_path), 'r')
-                xmlWSDL = ''
-                for line in fd:
-                    xmlWSDL += line
-                fd.close()
-                self.finish(xmlWSDL)
+        if query.upper() != 'WSDL':
+            return
+        if wsdl_path is not None:
+            xmlWSDL = await tornado.ioloop.IOLoop.current().run_in_executor(None, self._readWsdl, str(wsdl_path))
+            self.finish(xmlWSDL)
+            return
+
+        address = getattr(self, 'targetns_address', None)
+        if address is None:
+            address = _hostAddress()
+        port = self.request.headers['Host'].split(':')[1]
+        wsdl_nameservice = self.request.uri.replace('/', '').replace('?wsdl', '').replace('?WSDL', '')
+        xmlWSDL = _createWsdl(type(self), address, port, wsdl_nameservice)
+        self.finish(xmlWSDL)
+
+    def _readWsdl(self, path):
+        """ Private method that returns the contents of the wsdl file in path,
+            the file is read again only if it was modified.
+        """
+        return _readWsdlFile(path, os.path.getmtime(path))
 
     def post(self):
         """ Method post() to process of requests and responses SOAP messages """
         try:
             self._request = self._parseSoap(self.request.body)
             self.set_header('Content-Type', 'text/xml')
-            for operations in dir(self):
-                operation = getattr(self, operations)
-                if callable(operation) and hasattr(operation, '_is_operation'):
-                    params = []
-                    response = None
-                    typesinput = getattr(operation, '_input')
-                    args = getattr(operation, '_args')
-                    if inspect.isclass(typesinput) and issubclass(typesinput, complextypes.ComplexType):
-                        obj = self._parseComplexType(typesinput, self._request.getBody()[0])
-                        response = operation(obj)
-                    elif hasattr(operation, '_inputArray') and getattr(operation, '_inputArray'):
-                        params = self._parseParams(self._request.getBody()[0], typesinput, args)
-                        response = operation(params)
-                    else:
-                        params = self._parseParams(self._request.getBody()[0], typesinput, args)
-                        response = operation(*params)
-                    is_array = None
-                    if hasattr(operation, '_outputArray') and getattr(operation, '_outputArray'):
-                        is_array = getattr(operation, '_outputArray')
-
-                    typesoutput = getattr(operation, '_output')
-                    if inspect.isclass(typesoutput) and issubclass(typesoutput, complextypes.ComplexType):
-                        self._response = self._createReturnsComplexType(response)
-                    else:
-                        self._response = self._createReturns(response, is_array)
-
-            soapmsg = self._response.getSoap().toxml()
+            body = self._request.getBody()[0]
+            operation = self._soap_operations_by_name.get(_xml.localname(body))
+            if operation is None and len(self._soap_operations) == 1:
+                # a handler with a single operator (maybe with its own wsdl_path)
+                # answers any request, whatever the name of the element
+                operation = self._soap_operations[0]
+            if operation is None:
+                self._response = soapfault('Operation not found : %s' % _xml.localname(body))
+            else:
+                method = operation.__get__(self, type(self))
+                self._response = operation.encode(self, method(*operation.decode(self, body)))
+
+            soapmsg = _xml.tostring(self._response.getSoap(), declaration=True)
             self.write(soapmsg)
         except Exception as detail:
             fault = soapfault('Error in web service : %s' % detail)
-            # self.write(fault.getSoap().toxml())
+            # self.write(_xml.tostring(fault.getSoap(), declaration=True))
 
     def _parseSoap(self, xmldoc):
         """ Private method parse a message soap from a xmldoc like string
             _parseSoap() return a soap.SoapMessage().
         """
-        xmldoc = xmldoc.decode().replace('\n', ' ').replace('\t', ' ').replace('\r', ' ')
-        document = xml.dom.minidom.parseString(xmldoc)
-        prefix = document.documentElement.prefix
-        header = None
-        body = None
-        if prefix is not None:
-            header = document.getElementsByTagName(prefix + ':Header')
-            body = document.getElementsByTagName(prefix + ':Body')
-        else:
-            header = document.getElementsByTagName('Header')
-            body = document.getElementsByTagName('Body')
+        xmldoc = xmldoc.translate(_WHITESPACE)
+        envelope = _xml.parse(xmldoc)
+        namespace = _xml.namespace(envelope)
+        header = envelope.find(_xml.qname(namespace, 'Header'))
+        body = envelope.find(_xml.qname(namespace, 'Body'))
 
         header_elements = self._parseXML(header)
         body_elements = self._parseXML(body)
@@ -212,32 +328,19 @@ class SoapHandler(tornado.web.RequestHandler):
 
         return soapMsg
 
-    def _parseXML(self, elements):
-        """ Private method parse and digest the xml.dom.minidom.Element
+    def _parseXML(self, element):
+        """ Private method parse and digest the Header or Body element (or None)
             finding the childs of Header and Body from soap message.
             Return a list object with all of child Elements.
         """
-        elem_list = []
-        if len(elements) <= 0:
-            return elem_list
-        if elements[0].childNodes.length <= 0:
-            return elem_list
-        for element in elements[0].childNodes:
-            if element.nodeType == element.ELEMENT_NODE:
-                prefix = element.prefix
-                namespace = element.namespaceURI
-                if prefix is not None and namespace is not None:
-                    element.setAttribute('xmlns:' + prefix, namespace)
-                elem_list.append(xml.dom.minidom.parseString(element.toxml()))
-        return elem_list
+        if element is None:
+            return []
+        # the namespaces are part of the tag names, the childs can be moved as they are
+        return _xml.children(element)
 
     def _parseComplexType(self, complex, xmld):
         """ Private method for generate an instance of class nameclass. """
-        xsdd = '<xsd:schema xmlns:xsd="http://www.w3.org/2001/XMLSchema">'
-        xsdd += complex.toXSD()
-        xsdd += '</xsd:schema>'
-        xsd = xml.dom.minidom.parseString(xsdd)
-        obj = complextypes.xml2object(xmld.toxml(), xsd, complex)
+        obj = complextypes.xml2object(xmld, _xsdFor(complex), complex)
 
         return obj
 
@@ -246,29 +349,37 @@ class SoapHandler(tornado.web.RequestHandler):
             the values of the request document like parameters for the soapmethod,
             this method return a list values of parameters.
          """
+        # the descendants of the Body element are walked once, not once by argument
+        index = collections.defaultdict(list)
+        for e in elements.iter():
+            if e is not elements and isinstance(e.tag, str):
+                index[_xml.localname(e)].append(e)
         values = []
         for tagname in args:
             type = types[tagname]
-            values += self._findValues(tagname, type, elements)
+            values += self._findValues(tagname, type, index)
         return values
 
-    def _findValues(self, name, type, xml):
-        """ Private method to find the values of elements in the XML of input """
-        elems = xml.getElementsByTagName(name)
+    def _findValues(self, name, type, index):
+        """ Private method to find the values of elements in the XML of input,
+            index is a dictionary with the elements of the input by tag name.
+         """
         values = []
-        for e in elems:
-            if e.hasChildNodes and len(e.childNodes) > 0:
-                v = type.genType(e.childNodes[0].nodeValue)
-                values.append(v)
+        append = values.append
+        genType = type.genType
+        for e in index.get(name, ()):
+            text = e.text
+            if text is not None:
+                append(genType(text))
             else:
-                values.append(None)
+                append(None)
         return values
 
     def _createReturnsComplexType(self, result):
         """ Private method to generate the xml document with the response.
             Return an SoapMessage() with XML document.
         """
-        response = xml.dom.minidom.parseString(result.toXML())
+        response = result.toElement()
 
         soapResponse = soap.SoapMessage()
         soapResponse.setBody(response)
@@ -278,21 +389,18 @@ class SoapHandler(tornado.web.RequestHandler):
         """ Private method to generate the xml document with the response.
             Return an SoapMessage().
         """
-        xmlresponse = ''
+        response = _xml.Element('returns')
         if isinstance(result, list):
-            xmlresponse = '<returns>\n'
+            SubElement = _xml.SubElement
             i = 1
             for r in result:
                 if is_array is True:
-                    xmlresponse += '<value>%s</value>\n' % str(r)
+                    SubElement(response, 'value').text = str(r)
                 else:
-                    xmlresponse += '<value%d>%s</value%d>\n' % (i, str(r), i)
+                    SubElement(response, 'value%d' % i).text = str(r)
                 i += 1
-            xmlresponse += '</returns>\n'
         else:
-            xmlresponse = '<returns>%s</returns>\n' % str(result)
-
-        response = xml.dom.minidom.parseString(xmlresponse)
+            response.text = str(result)
 
         soapResponse = soap.SoapMessage()
         soapResponse.setBody(response)
@@ -16,7 +16,6 @@
 """ Class Wsdl to generate WSDL Document """
 from __future__ import unicode_literals
 from builtins import object
-import xml.dom.minidom
 import inspect
 from tornadows import xmltypes
 from tornadows import complextypes
@@ -48,78 +47,77 @@ class Wsdl(object):
         self._location = location
 
     def createWsdl(self):
+        """ Return the WSDL document as utf-8 encoded bytes. The document is
+            joined from its parts once, without parse it.
+        """
         typeInput = None
         typeOutput = None
-        types = '<wsdl:types>\n'
-        types += '<xsd:schema targetNamespace="%s">\n' % self._namespace
+        wsdl = ['<?xml version="1.0" encoding="utf-8"?>\n']
+        append = wsdl.append
+        append('<wsdl:definitions name="%s" ' % self._nameservice)
+        append('xmlns:xsd="http://www.w3.org/2001/XMLSchema" ')
+        append('xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" ')
+        append('xmlns:tns="%s" ' % self._namespace)
+        append('xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/" ')
+        append('xmlns:wsdl="http://schemas.xmlsoap.org/wsdl/" ')
+        append('targetNamespace="%s">\n' % self._namespace)
+
+        append('<wsdl:types>\n')
+        append('<xsd:schema targetNamespace="%s">\n' % self._namespace)
 
         if inspect.isclass(self._elementInput) and issubclass(self._elementInput, complextypes.ComplexType):
             typeInput = self._elementInput.getName()
-            types += self._elementInput.toXSD()
+            append(self._elementInput.toXSD())
         elif isinstance(self._elementInput, dict):
             typeInput = self._elementNameInput
-            types += self._createComplexTypes(self._elementNameInput, self._arguments, self._elementInput)
+            append(self._createComplexTypes(self._elementNameInput, self._arguments, self._elementInput))
         elif isinstance(self._elementInput, xmltypes.Array):
             typeInput = self._elementNameInput
-            types += self._elementInput.createArray(typeInput)
+            append(self._elementInput.createArray(typeInput))
         elif isinstance(self._elementInput, list) or issubclass(self._elementInput, xmltypes.PrimitiveType):
             typeInput = self._elementNameInput
-            types += self._createTypes(typeInput, self._elementInput)
+            append(self._createTypes(typeInput, self._elementInput))
 
         if inspect.isclass(self._elementOutput) and issubclass(self._elementOutput, complextypes.ComplexType):
             typeOutput = self._elementOutput.getName()
-            types += self._elementOutput.toXSD()
+            append(self._elementOutput.toXSD())
         elif isinstance(self._elementOutput, xmltypes.Array):
             typeOutput = self._elementNameOutput
-            types += self._elementOutput.createArray(typeOutput)
+            append(self._elementOutput.createArray(typeOutput))
         elif isinstance(self._elementOutput, list) or issubclass(self._elementOutput, xmltypes.PrimitiveType):
             typeOutput = self._elementNameOutput
-            types += self._createTypes(typeOutput, self._elementOutput)
-
-        types += '</xsd:schema>\n'
-        types += '</wsdl:types>\n'
-        messages = '<wsdl:message name="%sRequest">\n' % self._nameservice
-        messages += '<wsdl:part name="parameters" element="tns:%s"/>\n' % typeInput
-        messages += '</wsdl:message>\n'
-        messages += '<wsdl:message name="%sResponse">\n' % self._nameservice
-        messages += '<wsdl:part name="parameters" element="tns:%s"/>\n' % typeOutput
-        messages += '</wsdl:message>\n'
-        portType = '<wsdl:portType name="%sPortType">\n' % self._nameservice
-        portType += '<wsdl:operation name="%s">\n' % self._operation
-        portType += '<wsdl:input message="tns:%sRequest"/>\n' % self._nameservice
-        portType += '<wsdl:output message="tns:%sResponse"/>\n' % self._nameservice
-        portType += '</wsdl:operation>\n'
-        portType += '</wsdl:portType>\n'
-        binding = '<wsdl:binding name="%sBinding" type="tns:%sPortType">\n' % (self._nameservice, self._nameservice)
-        binding += '<soap:binding style="document" transport="http://schemas.xmlsoap.org/soap/http"/>\n'
-        binding += '<wsdl:operation name="%s">\n' % self._operation
-        binding += '<soap:operation soapAction="%s" style="document"/>\n' % self._location
-        binding += '<wsdl:input><soap:body use="literal"/></wsdl:input>\n'
-        binding += '<wsdl:output><soap:body use="literal"/></wsdl:output>\n'
-        binding += '</wsdl:operation>\n'
-        binding += '</wsdl:binding>\n'
-        service = '<wsdl:service name="%s">\n' % self._nameservice
-        service += '<wsdl:port name="%sPort" binding="tns:%sBinding">\n' % (self._nameservice, self._nameservice)
-        service += '<soap:address location="%s"/>\n' % self._location
-        service += '</wsdl:port>\n'
-        service += '</wsdl:service>\n'
+            append(self._createTypes(typeOutput, self._elementOutput))
 
-        definitions = '<wsdl:definitions name="%s"\n' % self._nameservice
-        definitions += 'xmlns:xsd="http://www.w3.org/2001/XMLSchema"\n'
-        definitions += 'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"\n'
-        definitions += 'xmlns:tns="%s"\n' % self._namespace
-        definitions += 'xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/"\n'
-        definitions += 'xmlns:wsdl="http://schemas.xmlsoap.org/wsdl/"\n'
-        definitions += 'targetNamespace="%s">\n' % self._namespace
-        definitions += types
-        definitions += messages
-        definitions += portType
-        definitions += binding
-        definitions += service
-        definitions += '</wsdl:definitions>\n'
-        wsdlXml = xml.dom.minidom.parseString(definitions)
+        append('</xsd:schema>\n')
+        append('</wsdl:types>\n')
+        append('<wsdl:message name="%sRequest">\n' % self._nameservice)
+        append('<wsdl:part name="parameters" element="tns:%s"/>\n' % typeInput)
+        append('</wsdl:message>\n')
+        append('<wsdl:message name="%sResponse">\n' % self._nameservice)
+        append('<wsdl:part name="parameters" element="tns:%s"/>\n' % typeOutput)
+        append('</wsdl:message>\n')
+        append('<wsdl:portType name="%sPortType">\n' % self._nameservice)
+        append('<wsdl:operation name="%s">\n' % self._operation)
+        append('<wsdl:input message="tns:%sRequest"/>\n' % self._nameservice)
+        append('<wsdl:output message="tns:%sResponse"/>\n' % self._nameservice)
+        append('</wsdl:operation>\n')
+        append('</wsdl:portType>\n')
+        append('<wsdl:binding name="%sBinding" type="tns:%sPortType">\n' % (self._nameservice, self._nameservice))
+        append('<soap:binding style="document" transport="http://schemas.xmlsoap.org/soap/http"/>\n')
+        append('<wsdl:operation name="%s">\n' % self._operation)
+        append('<soap:operation soapAction="%s" style="document"/>\n' % self._location)
+        append('<wsdl:input><soap:body use="literal"/></wsdl:input>\n')
+        append('<wsdl:output><soap:body use="literal"/></wsdl:output>\n')
+        append('</wsdl:operation>\n')
+        append('</wsdl:binding>\n')
+        append('<wsdl:service name="%s">\n' % self._nameservice)
+        append('<wsdl:port name="%sPort" binding="tns:%sBinding">\n' % (self._nameservice, self._nameservice))
+        append('<soap:address location="%s"/>\n' % self._location)
+        append('</wsdl:port>\n')
+        append('</wsdl:service>\n')
+        append('</wsdl:definitions>\n')
 
-        return wsdlXml
+        return ''.join(wsdl).encode('utf-8')
 
     def _createTypes(self, name, elements):
         elem = ''